@@ -1,10 +1,14 @@
 import argparse
 import json
+import logging
 import os
 from os import environ as env
 
+from rich.logging import RichHandler
+
 from book_maker.loader import BOOK_LOADER_DICT
 from book_maker.translator import MODEL_DICT
+from book_maker.translator.translation_memory import DEFAULT_TM_CACHE_PATH
 from book_maker.utils import LANGUAGES, TO_LANGUAGE_CODE
 
 
@@ -436,6 +440,15 @@ So you are close to reaching the limit. You have to choose your own value, there
         help="Configure Claude Code SDK options as JSON string or path to JSON file. Example: --agentic_options '{\"allowed_tools\":[\"Read\",\"WebSearch\"],\"max_turns\":2}'",
     )
 
+    parser.add_argument(
+        "--tm_cache_path",
+        dest="tm_cache_path",
+        type=str,
+        nargs="?",
+        const=DEFAULT_TM_CACHE_PATH,
+        help=f"Reuse translations across runs by storing them in a SQLite file (default path: {DEFAULT_TM_CACHE_PATH}). Supports ChatGPT-compatible models, `deepseek` and `claude-code`, ignored with --use_context",
+    )
+
     options = parser.parse_args()
 
     if not options.book_name:
@@ -450,6 +463,15 @@ So you are close to reaching the limit. You have to choose your own value, there
         os.environ["http_proxy"] = PROXY
         os.environ["https_proxy"] = PROXY
 
+    # Translators that log their paragraphs show them through rich, written
+    # from the translating thread so they stay in order with the loader output
+    translator_logger = logging.getLogger("book_maker.translator")
+    translator_logger.addHandler(
+        RichHandler(markup=True, show_time=False, show_level=False, show_path=False)
+    )
+    translator_logger.setLevel(logging.INFO)
+    translator_logger.propagate = False
+
     # Determine if we should use agentic mode
     use_agentic = options.agentic or options.model.startswith("claude-code") or options.model.startswith("glm")
     
@@ -657,6 +679,8 @@ So you are close to reaching the limit. You have to choose your own value, there
         e.translate_model.set_claude_model(options.model)
     if options.model.startswith("qwen-"):
         e.translate_model.set_qwen_model(options.model)
+    if options.tm_cache_path:
+        e.translate_model.set_tm_cache_path(options.tm_cache_path)
     if options.block_size > 0:
         e.block_size = options.block_size
     if options.batch_flag:
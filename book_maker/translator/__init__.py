@@ -1,54 +1,89 @@
-from book_maker.translator.caiyun_translator import Caiyun
-from book_maker.translator.chatgptapi_translator import ChatGPTAPI
-from book_maker.translator.deepl_translator import DeepL
-from book_maker.translator.deepl_free_translator import DeepLFree
-from book_maker.translator.google_translator import Google
-from book_maker.translator.claude_translator import Claude
-from book_maker.translator.deepseek_translator import DeepSeekTranslator
-from book_maker.translator.gemini_translator import Gemini
-from book_maker.translator.groq_translator import GroqClient
-from book_maker.translator.tencent_transmart_translator import TencentTranSmart
-from book_maker.translator.custom_api_translator import CustomAPI
-from book_maker.translator.xai_translator import XAIClient
-from book_maker.translator.qwen_translator import QwenTranslator
-from book_maker.translator.claude_code_translator import ClaudeCodeTranslator
-
-MODEL_DICT = {
-    "openai": ChatGPTAPI,
-    "chatgptapi": ChatGPTAPI,
-    "gpt4": ChatGPTAPI,
-    "gpt4omini": ChatGPTAPI,
-    "gpt4o": ChatGPTAPI,
-    "o1preview": ChatGPTAPI,
-    "o1": ChatGPTAPI,
-    "o1mini": ChatGPTAPI,
-    "o3mini": ChatGPTAPI,
-    "google": Google,
-    "caiyun": Caiyun,
-    "deepl": DeepL,
-    "deeplfree": DeepLFree,
-    "claude": Claude,
-    "claude-3-5-sonnet-latest": Claude,
-    "claude-3-5-sonnet-20241022": Claude,
-    "claude-3-5-sonnet-20240620": Claude,
-    "claude-3-5-haiku-latest": Claude,
-    "claude-3-5-haiku-20241022": Claude,
-    "gemini": Gemini,
-    "geminipro": Gemini,
-    "groq": GroqClient,
-    "tencentransmart": TencentTranSmart,
-    "customapi": CustomAPI,
-    "xai": XAIClient,
-    "qwen": QwenTranslator,
-    "qwen-mt-turbo": QwenTranslator,
-    "qwen-mt-plus": QwenTranslator,
-    "claude-code": ClaudeCodeTranslator,
-    "claude-code-sonnet": ClaudeCodeTranslator,
-    "claude-code-opus": ClaudeCodeTranslator,
-    "glm-4.5": ClaudeCodeTranslator,
-    "glm": ClaudeCodeTranslator,
-    "deepseek": DeepSeekTranslator,
-    "deepseek-chat": DeepSeekTranslator,
-    "deepseek-reasoner": DeepSeekTranslator,
-    # add more here
+import importlib
+
+# translator class name -> module defining it, imported on first use so that
+# only the SDK of the selected model is loaded
+_TRANSLATOR_MODULES = {
+    "Caiyun": "book_maker.translator.caiyun_translator",
+    "ChatGPTAPI": "book_maker.translator.chatgptapi_translator",
+    "DeepL": "book_maker.translator.deepl_translator",
+    "DeepLFree": "book_maker.translator.deepl_free_translator",
+    "Google": "book_maker.translator.google_translator",
+    "Claude": "book_maker.translator.claude_translator",
+    "DeepSeekTranslator": "book_maker.translator.deepseek_translator",
+    "Gemini": "book_maker.translator.gemini_translator",
+    "GroqClient": "book_maker.translator.groq_translator",
+    "TencentTranSmart": "book_maker.translator.tencent_transmart_translator",
+    "CustomAPI": "book_maker.translator.custom_api_translator",
+    "XAIClient": "book_maker.translator.xai_translator",
+    "QwenTranslator": "book_maker.translator.qwen_translator",
+    "ClaudeCodeTranslator": "book_maker.translator.claude_code_translator",
 }
+
+
+class _LazyModelDict(dict):
+    """Maps model names to translator classes, importing each class on first access"""
+
+    def __getitem__(self, key):
+        value = super().__getitem__(key)
+        if isinstance(value, str):
+            value = getattr(importlib.import_module(_TRANSLATOR_MODULES[value]), value)
+            super().__setitem__(key, value)
+        return value
+
+    def get(self, key, default=None):
+        return self[key] if key in self else default
+
+    def values(self):
+        return [self[key] for key in self]
+
+    def items(self):
+        return [(key, self[key]) for key in self]
+
+
+def __getattr__(name):
+    if name in _TRANSLATOR_MODULES:
+        return getattr(importlib.import_module(_TRANSLATOR_MODULES[name]), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+MODEL_DICT = _LazyModelDict(
+    {
+        "openai": "ChatGPTAPI",
+        "chatgptapi": "ChatGPTAPI",
+        "gpt4": "ChatGPTAPI",
+        "gpt4omini": "ChatGPTAPI",
+        "gpt4o": "ChatGPTAPI",
+        "o1preview": "ChatGPTAPI",
+        "o1": "ChatGPTAPI",
+        "o1mini": "ChatGPTAPI",
+        "o3mini": "ChatGPTAPI",
+        "google": "Google",
+        "caiyun": "Caiyun",
+        "deepl": "DeepL",
+        "deeplfree": "DeepLFree",
+        "claude": "Claude",
+        "claude-3-5-sonnet-latest": "Claude",
+        "claude-3-5-sonnet-20241022": "Claude",
+        "claude-3-5-sonnet-20240620": "Claude",
+        "claude-3-5-haiku-latest": "Claude",
+        "claude-3-5-haiku-20241022": "Claude",
+        "gemini": "Gemini",
+        "geminipro": "Gemini",
+        "groq": "GroqClient",
+        "tencentransmart": "TencentTranSmart",
+        "customapi": "CustomAPI",
+        "xai": "XAIClient",
+        "qwen": "QwenTranslator",
+        "qwen-mt-turbo": "QwenTranslator",
+        "qwen-mt-plus": "QwenTranslator",
+        "claude-code": "ClaudeCodeTranslator",
+        "claude-code-sonnet": "ClaudeCodeTranslator",
+        "claude-code-opus": "ClaudeCodeTranslator",
+        "glm-4.5": "ClaudeCodeTranslator",
+        "glm": "ClaudeCodeTranslator",
+        "deepseek": "DeepSeekTranslator",
+        "deepseek-chat": "DeepSeekTranslator",
+        "deepseek-reasoner": "DeepSeekTranslator",
+        # add more here
+    }
+)
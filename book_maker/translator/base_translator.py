@@ -1,11 +1,20 @@
+import hashlib
 import itertools
 from abc import ABC, abstractmethod
+from collections import OrderedDict
+
+from .translation_memory import DiskTM
 
 
 class Base(ABC):
+    # max entries kept by the in-memory translation memory
+    tm_cache_size = 4096
+
     def __init__(self, key, language) -> None:
         self.keys = itertools.cycle(key.split(","))
         self.language = language
+        self._tm_cache = OrderedDict()
+        self._disk_tm = None
 
     @abstractmethod
     def rotate_key(self):
@@ -17,3 +26,45 @@ class Base(ABC):
 
     def set_deployment_id(self, deployment_id):
         pass
+
+    def set_tm_cache_path(self, path):
+        """Persist the translation memory to a SQLite file at `path`"""
+        self._disk_tm = DiskTM(path)
+
+    def _tm_key(self, text, model):
+        # editing the prompt changes the output, so it is part of the key
+        prompt_hash = hashlib.blake2b(
+            f"{getattr(self, 'prompt_sys_msg', '')}|{getattr(self, 'prompt_template', '')}".encode(),
+            digest_size=8,
+        ).hexdigest()
+        return hashlib.blake2b(
+            f"{self.language}|{model}|{prompt_hash}|{text}".encode(), digest_size=16
+        ).digest()
+
+    def get_cached_translation(self, text, model):
+        """Return a previous translation of the exact same text, or None"""
+        key = self._tm_key(text, model)
+        t_text = self._tm_cache.get(key)
+        if t_text is not None:
+            self._tm_cache.move_to_end(key)
+            return t_text
+        if self._disk_tm is not None:
+            t_text = self._disk_tm.get(key)
+            if t_text is not None:
+                self._remember(key, t_text)
+        return t_text
+
+    def cache_translation(self, text, model, t_text):
+        """Remember a translation, evicting the least recently used one when full"""
+        if not t_text:
+            return
+        key = self._tm_key(text, model)
+        self._remember(key, t_text)
+        if self._disk_tm is not None:
+            self._disk_tm.put(key, t_text)
+
+    def _remember(self, key, t_text):
+        self._tm_cache[key] = t_text
+        self._tm_cache.move_to_end(key)
+        if len(self._tm_cache) > self.tm_cache_size:
+            self._tm_cache.popitem(last=False)
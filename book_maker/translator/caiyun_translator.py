@@ -7,6 +7,8 @@ from rich import print
 
 from .base_translator import Base
 
+_MULTI_NL = re.compile(r"\n{3,}")
+
 
 class Caiyun(Base):
     """
@@ -65,7 +67,7 @@ class Caiyun(Base):
             )
             t_text = response.json()["target"]
 
-        print("[bold green]" + re.sub("\n{3,}", "\n\n", t_text) + "[/bold green]")
+        print("[bold green]" + _MULTI_NL.sub("\n\n", t_text) + "[/bold green]")
         # for issue #279
         if num:
             t_text = str(num) + "\n" + t_text
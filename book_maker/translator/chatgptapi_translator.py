@@ -2,6 +2,7 @@ import re
 import time
 import os
 import shutil
+from collections import deque
 from copy import copy
 from os import environ
 from itertools import cycle
@@ -13,6 +14,8 @@ from rich import print
 from .base_translator import Base
 from ..config import config
 
+_MULTI_NL = re.compile(r"\n{3,}")
+
 CHATGPT_CONFIG = config["translator"]["chatgptapi"]
 
 PROMPT_ENV_MAP = {
@@ -102,15 +105,21 @@ class ChatGPTAPI(Base):
         self.deployment_id = None
         self.temperature = temperature
         self.model_list = None
+        self._model_names = ()
         self.context_flag = context_flag
-        self.context_list = []
-        self.context_translated_list = []
         if context_paragraph_limit > 0:
             # not set by user, use default
             self.context_paragraph_limit = context_paragraph_limit
         else:
             # set by user, use user's value
             self.context_paragraph_limit = CHATGPT_CONFIG["context_paragraph_limit"]
+        # the oldest context is dropped automatically once the limit is reached
+        self.context_list = deque(maxlen=self.context_paragraph_limit)
+        self.context_translated_list = deque(maxlen=self.context_paragraph_limit)
+        if not self.context_flag:
+            # no context to build or keep, skip the calls per paragraph
+            self.create_context_messages = lambda: []
+            self.save_context = lambda text, t_text: None
         self.batch_text_list = []
         self.batch_info_cache = None
         self.result_content_cache = {}
@@ -121,6 +130,14 @@ class ChatGPTAPI(Base):
     def rotate_model(self):
         self.model = next(self.model_list)
 
+    def _use_models(self, model_list):
+        self._model_names = tuple(model_list)
+        self.model_list = cycle(self._model_names)
+
+    def _tm_model(self):
+        """Models the paragraph may be sent to, known before rotating"""
+        return ",".join(sorted(self._model_names))
+
     def create_messages(self, text, intermediate_messages=None):
         content = self.prompt_template.format(
             text=text, language=self.language, crlf="\n"
@@ -159,6 +176,13 @@ class ChatGPTAPI(Base):
         return completion
 
     def get_translation(self, text):
+        # context changes the output, so only reuse translations without it;
+        # a hit doesn't use up a key or model of the rotation
+        if not self.context_flag:
+            t_text = self.get_cached_translation(text, self._tm_model())
+            if t_text is not None:
+                return t_text
+
         self.rotate_key()
         self.rotate_model()  # rotate all the model to avoid the limit
 
@@ -173,6 +197,8 @@ class ChatGPTAPI(Base):
 
         if self.context_flag:
             self.save_context(text, t_text)
+        else:
+            self.cache_translation(text, self._tm_model(), t_text)
 
         return t_text
 
@@ -180,16 +206,12 @@ class ChatGPTAPI(Base):
         if self.context_paragraph_limit > 0:
             self.context_list.append(text)
             self.context_translated_list.append(t_text)
-            # Remove the oldest context
-            if len(self.context_list) > self.context_paragraph_limit:
-                self.context_list.pop(0)
-                self.context_translated_list.pop(0)
 
     def translate(self, text, needprint=True):
         start_time = time.time()
         # todo: Determine whether to print according to the cli option
         if needprint:
-            print(re.sub("\n{3,}", "\n\n", text))
+            print(_MULTI_NL.sub("\n\n", text))
 
         attempt_count = 0
         max_attempts = 3
@@ -217,7 +239,7 @@ class ChatGPTAPI(Base):
 
         # todo: Determine whether to print according to the cli option
         if needprint:
-            print("[bold green]" + re.sub("\n{3,}", "\n\n", t_text) + "[/bold green]")
+            print("[bold green]" + _MULTI_NL.sub("\n\n", t_text) + "[/bold green]")
 
         time.time() - start_time
         # print(f"translation time: {elapsed_time:.1f}s")
@@ -437,107 +459,107 @@ class ChatGPTAPI(Base):
 
     def set_gpt35_models(self, ollama_model=""):
         if ollama_model:
-            self.model_list = cycle([ollama_model])
+            self._use_models([ollama_model])
             return
         # gpt3 all models for save the limit
         if self.deployment_id:
-            self.model_list = cycle(["gpt-35-turbo"])
+            self._use_models(["gpt-35-turbo"])
         else:
             my_model_list = [
                 i["id"] for i in self.openai_client.models.list().model_dump()["data"]
             ]
             model_list = list(set(my_model_list) & set(GPT35_MODEL_LIST))
             print(f"Using model list {model_list}")
-            self.model_list = cycle(model_list)
+            self._use_models(model_list)
 
     def set_gpt4_models(self):
         # for issue #375 azure can not use model list
         if self.deployment_id:
-            self.model_list = cycle(["gpt-4"])
+            self._use_models(["gpt-4"])
         else:
             my_model_list = [
                 i["id"] for i in self.openai_client.models.list().model_dump()["data"]
             ]
             model_list = list(set(my_model_list) & set(GPT4_MODEL_LIST))
             print(f"Using model list {model_list}")
-            self.model_list = cycle(model_list)
+            self._use_models(model_list)
 
     def set_gpt4omini_models(self):
         # for issue #375 azure can not use model list
         if self.deployment_id:
-            self.model_list = cycle(["gpt-4o-mini"])
+            self._use_models(["gpt-4o-mini"])
         else:
             my_model_list = [
                 i["id"] for i in self.openai_client.models.list().model_dump()["data"]
             ]
             model_list = list(set(my_model_list) & set(GPT4oMINI_MODEL_LIST))
             print(f"Using model list {model_list}")
-            self.model_list = cycle(model_list)
+            self._use_models(model_list)
 
     def set_gpt4o_models(self):
         # for issue #375 azure can not use model list
         if self.deployment_id:
-            self.model_list = cycle(["gpt-4o"])
+            self._use_models(["gpt-4o"])
         else:
             my_model_list = [
                 i["id"] for i in self.openai_client.models.list().model_dump()["data"]
             ]
             model_list = list(set(my_model_list) & set(GPT4o_MODEL_LIST))
             print(f"Using model list {model_list}")
-            self.model_list = cycle(model_list)
+            self._use_models(model_list)
 
     def set_o1preview_models(self):
         # for issue #375 azure can not use model list
         if self.deployment_id:
-            self.model_list = cycle(["o1-preview"])
+            self._use_models(["o1-preview"])
         else:
             my_model_list = [
                 i["id"] for i in self.openai_client.models.list().model_dump()["data"]
             ]
             model_list = list(set(my_model_list) & set(O1PREVIEW_MODEL_LIST))
             print(f"Using model list {model_list}")
-            self.model_list = cycle(model_list)
+            self._use_models(model_list)
 
     def set_o1_models(self):
         # for issue #375 azure can not use model list
         if self.deployment_id:
-            self.model_list = cycle(["o1"])
+            self._use_models(["o1"])
         else:
             my_model_list = [
                 i["id"] for i in self.openai_client.models.list().model_dump()["data"]
             ]
             model_list = list(set(my_model_list) & set(O1_MODEL_LIST))
             print(f"Using model list {model_list}")
-            self.model_list = cycle(model_list)
+            self._use_models(model_list)
 
     def set_o1mini_models(self):
         # for issue #375 azure can not use model list
         if self.deployment_id:
-            self.model_list = cycle(["o1-mini"])
+            self._use_models(["o1-mini"])
         else:
             my_model_list = [
                 i["id"] for i in self.openai_client.models.list().model_dump()["data"]
             ]
             model_list = list(set(my_model_list) & set(O1MINI_MODEL_LIST))
             print(f"Using model list {model_list}")
-            self.model_list = cycle(model_list)
+            self._use_models(model_list)
 
     def set_o3mini_models(self):
         # for issue #375 azure can not use model list
         if self.deployment_id:
-            self.model_list = cycle(["o3-mini"])
+            self._use_models(["o3-mini"])
         else:
             my_model_list = [
                 i["id"] for i in self.openai_client.models.list().model_dump()["data"]
             ]
             model_list = list(set(my_model_list) & set(O3MINI_MODEL_LIST))
             print(f"Using model list {model_list}")
-            self.model_list = cycle(model_list)
+            self._use_models(model_list)
 
     def set_model_list(self, model_list):
         model_list = list(set(model_list))
         print(f"Using model list {model_list}")
-        self.model_list = cycle(model_list)
+        self._use_models(model_list)
 
     def batch_init(self, book_name):
         self.book_name = self.sanitize_book_name(book_name)
@@ -1,16 +1,100 @@
+import os
 import re
 import json
+import atexit
+import random
 import asyncio
-from typing import Optional, List, Dict, Any
-from rich import print
+import logging
+import functools
+import threading
+from collections import deque
+from copy import copy
 
 from .base_translator import Base
 
-try:
-    from claude_code_sdk import query, ClaudeCodeOptions, ClaudeSDKClient
-    HAS_CLAUDE_CODE_SDK = True
-except ImportError:
-    HAS_CLAUDE_CODE_SDK = False
+
+@functools.cache
+def _load_sdk():
+    """
+    Import the Claude Code SDK on first agentic use, so that it and its
+    dependencies are not loaded for the regular Claude fallback.
+    Returns the claude_code_sdk module, or None when it is not installed.
+    """
+    try:
+        import claude_code_sdk
+    except ImportError:
+        return None
+    return claude_code_sdk
+
+
+def __getattr__(name):
+    # HAS_CLAUDE_CODE_SDK is resolved lazily, on first access
+    if name == "HAS_CLAUDE_CODE_SDK":
+        return _load_sdk() is not None
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+_MULTI_NL = re.compile(r"\n{3,}")
+# Errors a retry can't fix: bad credentials, unknown model, malformed request
+_PERMANENT_ERROR = re.compile(
+    r"authentication_error|permission_error|not_found_error|invalid_request_error"
+    r"|invalid api key|API Error: 40[0134]\b",
+    re.IGNORECASE,
+)
+
+# Paragraphs and translations are logged at INFO; the CLI shows them through rich
+logger = logging.getLogger(__name__)
+
+
+# A single event loop running on a daemon thread is shared by all translator
+# instances, so the SDK state survives between paragraphs instead of being
+# rebuilt by asyncio.run() on every call.
+_loop = None
+_loop_lock = threading.Lock()
+
+
+def _get_background_loop():
+    """Return the shared background event loop, starting it on first use"""
+    global _loop
+    with _loop_lock:
+        if _loop is None:
+            _loop = asyncio.new_event_loop()
+            threading.Thread(
+                target=_loop.run_forever,
+                name="claude-code-loop",
+                daemon=True,
+            ).start()
+            atexit.register(_stop_background_loop)
+    return _loop
+
+
+def _stop_background_loop():
+    """Cancel whatever still runs on the background loop, ending open queries"""
+
+    async def cancel_all():
+        tasks = [t for t in asyncio.all_tasks() if t is not asyncio.current_task()]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    if _loop.is_running():
+        asyncio.run_coroutine_threadsafe(cancel_all(), _loop).result(timeout=10)
+        _loop.call_soon_threadsafe(_loop.stop)
+
+
+async def _gather_or_cancel(*aws):
+    """
+    Like asyncio.gather, but cancel the others as soon as one fails, so no
+    more requests are paid for once the result is going to be thrown away.
+    """
+    tasks = [asyncio.ensure_future(aw) for aw in aws]
+    try:
+        return await asyncio.gather(*tasks)
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        raise
 
 
 class ClaudeCodeTranslator(Base):
@@ -19,6 +103,13 @@ class ClaudeCodeTranslator(Base):
     Falls back to regular Claude translator if SDK is not available.
     """
     
+    DEFAULT_PROMPT = "Translate the following text into {language}. Provide ONLY the translation without any additional text or explanation:\n\n{text}"
+    BATCH_PROMPT = (
+        "Translate each string in the following JSON array into {language}. "
+        "Output ONLY a JSON array of the {count} translated strings in the same order, "
+        "without any additional text or explanation:\n\n{texts}"
+    )
+
     def __init__(
         self,
         key,
@@ -43,7 +134,8 @@ class ClaudeCodeTranslator(Base):
         self.agentic_options = agentic_options or {}
         
         # Check if agentic mode is requested but SDK is missing
-        if self.agentic and not HAS_CLAUDE_CODE_SDK:
+        self._sdk = _load_sdk() if self.agentic else None
+        if self.agentic and self._sdk is None:
             raise ImportError(
                 "Claude Code SDK is not installed. Please install it with:\n"
                 "pip install bbook-maker[agentic] or pip install claude-code-sdk"
@@ -51,7 +143,7 @@ class ClaudeCodeTranslator(Base):
         
         # If not agentic or SDK missing, fall back to regular Claude
         # Regular Claude DOES need an API key
-        if not self.agentic or not HAS_CLAUDE_CODE_SDK:
+        if not self.agentic or self._sdk is None:
             if not key:
                 raise ValueError(
                     "API key is required for regular Claude mode. "
@@ -71,20 +163,37 @@ class ClaudeCodeTranslator(Base):
             )
         else:
             self._fallback = None
+        self._loop = None if self._fallback else _get_background_loop()
         
+        if not self._fallback:
+            # Configure environment variables for BigModel.cn if not already set,
+            # once, before any Claude Code process inherits them
+            os.environ.setdefault(
+                "ANTHROPIC_BASE_URL", "https://open.bigmodel.cn/api/anthropic"
+            )
+            os.environ.setdefault("ANTHROPIC_MODEL", "glm-4.5")
+
         # Translation settings
-        self.prompt_template = (
-            prompt_template
-            or "Translate the following text into {language}. Provide ONLY the translation without any additional text or explanation:\n\n{text}"
-        )
+        self.prompt_template = prompt_template or self.DEFAULT_PROMPT
         self.prompt_sys_msg = prompt_sys_msg or "You are a professional translator. Always provide only the translation without any additional commentary or explanations."
         self.temperature = temperature
+        # Sent ahead of every prompt and never changes, so build it once
+        self._system_prefix = (
+            f"System: {self.prompt_sys_msg}\n\n" if self.prompt_sys_msg else ""
+        )
+        self._prompt_fn = self._bind_prompt_template()
         
         # Context management (compatible with existing translators)
         self.context_flag = context_flag
-        self.context_list = []
-        self.context_translated_list = []
         self.context_paragraph_limit = context_paragraph_limit
+        # Rendered "Original/Translation" pairs and the context built from them
+        # once per save_context, not per prompt
+        self._context_entries = deque(maxlen=max(context_paragraph_limit, 0))
+        self._context_cache = ""
+        if not self.context_flag:
+            # No context to build or keep, skip the calls per paragraph
+            self.create_context_messages = lambda: ""
+            self.save_context = lambda text, t_text: None
         
         # Default agentic options
         self.default_agentic_options = {
@@ -100,121 +209,282 @@ class ClaudeCodeTranslator(Base):
         if 'model' not in self.sdk_options:
             self.sdk_options['model'] = 'glm-4.5'  # Default to GLM4.5 model
 
+        # Translator-level settings, not passed through to ClaudeCodeOptions
+        self.max_concurrency = self.sdk_options.pop("max_concurrency", 8)
+        self._sem = asyncio.Semaphore(self.max_concurrency)
+        self.max_retries = self.sdk_options.pop("max_retries", 3)
+        self.base_delay = self.sdk_options.pop("base_delay", 1.0)
+        # Paragraphs sent in one prompt by translate_list
+        self.batch_size = self.sdk_options.pop("batch_size", 10)
+
     def rotate_key(self):
         """Rotate API keys if multiple are provided"""
         pass
 
+    def _bind_prompt_template(self):
+        """
+        Format the language into the template once and split it around {text},
+        so each paragraph only needs a concatenation instead of str.format.
+        """
+        marker = "\0text\0"
+        try:
+            bound = self.prompt_template.format(text=marker, language=self.language)
+        except (KeyError, IndexError, ValueError):
+            bound = None
+        if bound is not None and bound.count(marker) == 1:
+            prefix, suffix = bound.split(marker)
+            return lambda text: f"{prefix}{text}{suffix}"
+        # Unusual templates keep the original per-call formatting (and its errors)
+        return lambda text: self.prompt_template.format(
+            text=text, language=self.language
+        )
+
     def create_context_messages(self):
         """Create context from previous translations (compatible with existing pattern)"""
-        if not self.context_flag or not self.context_list:
+        if not self.context_flag:
             return ""
         
-        context = "Previous context:\n"
-        for orig, trans in zip(self.context_list, self.context_translated_list):
-            context += f"Original: {orig}\nTranslation: {trans}\n\n"
-        return context
+        return self._context_cache
 
     def save_context(self, text, t_text):
         """Save translation pair to context"""
         if not self.context_flag:
             return
         
-        self.context_list.append(text)
-        self.context_translated_list.append(t_text)
-        
-        # Keep only recent paragraphs within limit
-        if len(self.context_list) > self.context_paragraph_limit:
-            self.context_list.pop(0)
-            self.context_translated_list.pop(0)
+        self._context_entries.append(f"Original: {text}\nTranslation: {t_text}\n\n")
+        if self._context_entries:
+            self._context_cache = "".join(
+                ("Previous context:\n", *self._context_entries)
+            )
 
     def _sync_wrapper(self, coro):
         """
-        Safely run async code in sync context.
-        Handles cases where event loop might already be running.
+        Run async code on the shared background loop and wait for the result.
+        Works the same whether or not the caller already has a running loop.
         """
         try:
-            loop = asyncio.get_running_loop()
-            # If we're in a running loop, we need a different approach
-            # This is a simplified version - in production you might use anyio or nest_asyncio
-            import concurrent.futures
-            with concurrent.futures.ThreadPoolExecutor() as pool:
-                future = pool.submit(asyncio.run, coro)
-                return future.result()
+            running_loop = asyncio.get_running_loop()
         except RuntimeError:
-            # No running loop, we can use asyncio.run directly
-            return asyncio.run(coro)
+            running_loop = None
+        if running_loop is not None and running_loop is self._loop:
+            # Blocking here would deadlock the loop the coroutine needs
+            coro.close()
+            raise RuntimeError(
+                "translate() cannot be called from the background loop; "
+                "await _agentic_translate() directly instead."
+            )
+        return asyncio.run_coroutine_threadsafe(coro, self._loop).result()
+
+    async def _run_query(self, prompt):
+        """
+        Send one prompt to a fresh Claude Code process. A ClaudeSDKClient kept
+        open across prompts would carry them all in one conversation, so each
+        translation would pay for and depend on the previous ones.
+        """
+        options = self._sdk.ClaudeCodeOptions(**self.sdk_options)
+        chunks = []
+        async for message in self._sdk.query(prompt=prompt, options=options):
+            if getattr(message, "is_error", False):
+                raise self._sdk.ProcessError(
+                    f"Claude Code returned an error: {message.result}"
+                )
+            if hasattr(message, "content"):
+                for block in message.content:
+                    if hasattr(block, "text"):
+                        chunks.append(block.text)
+        return "".join(chunks).strip()
 
     async def _agentic_translate(self, text):
         """Perform translation using Claude Code SDK"""
         # Build the full prompt with context if available
         context = self.create_context_messages()
-        full_prompt = ""
-        
-        if self.prompt_sys_msg:
-            full_prompt = f"System: {self.prompt_sys_msg}\n\n"
-        
-        if context:
-            full_prompt += f"{context}\n"
-        
-        full_prompt += self.prompt_template.format(
-            text=text,
-            language=self.language
+        full_prompt = "".join(
+            (
+                self._system_prefix,
+                f"{context}\n" if context else "",
+                self._prompt_fn(text),
+            )
         )
         
-        # Create SDK options
-        options = ClaudeCodeOptions(**self.sdk_options)
-        
-        # Configure environment variables for BigModel.cn if not already set
-        import os
-        if not os.getenv('ANTHROPIC_BASE_URL'):
-            os.environ['ANTHROPIC_BASE_URL'] = 'https://open.bigmodel.cn/api/anthropic'
-        if not os.getenv('ANTHROPIC_MODEL'):
-            os.environ['ANTHROPIC_MODEL'] = 'glm-4.5'
-        
-        # Perform the translation
-        response_text = ""
-        async for message in query(prompt=full_prompt, options=options):
-            if hasattr(message, 'content'):
-                for block in message.content:
-                    if hasattr(block, 'text'):
-                        response_text += block.text
-        
-        return response_text.strip()
+        return await self._query_with_retry(full_prompt)
+
+    async def _query_with_retry(self, full_prompt):
+        """Send a prompt, backing off on rate limits and transient CLI failures"""
+        for attempt in range(self.max_retries + 1):
+            try:
+                return await self._run_query(full_prompt)
+            except self._sdk.CLINotFoundError:
+                raise
+            except (self._sdk.CLIConnectionError, self._sdk.ProcessError) as e:
+                if _PERMANENT_ERROR.search(str(e)):
+                    raise
+                if attempt == self.max_retries:
+                    logger.error("Get %d consecutive exceptions", attempt + 1)
+                    raise
+                sleep_time = self.base_delay * 2**attempt + random.random()
+                logger.warning("%s will sleep %.1f seconds", e, sleep_time)
+                await asyncio.sleep(sleep_time)
+
+    async def _agentic_translate_batch(self, texts):
+        """
+        Translate several paragraphs with a single prompt, so the system message
+        is only sent once. Falls back to one prompt per paragraph if the reply
+        is not a JSON array of the expected length.
+        """
+        if len(texts) == 1:
+            return [await self._agentic_translate(texts[0])]
+
+        full_prompt = self._system_prefix + self.BATCH_PROMPT.format(
+            language=self.language,
+            count=len(texts),
+            texts=json.dumps(texts, ensure_ascii=False, indent=0),
+        )
+
+        response = await self._query_with_retry(full_prompt)
+        t_texts = self._parse_batch_response(response, len(texts))
+        if t_texts is None:
+            logger.warning(
+                "Warning: batch reply could not be parsed, translating %d paragraphs one by one",
+                len(texts),
+            )
+            t_texts = await _gather_or_cancel(
+                *[self._agentic_translate(text) for text in texts]
+            )
+        return t_texts
+
+    @staticmethod
+    def _parse_batch_response(response, count):
+        """Extract the JSON array of translations from a batch reply, or None"""
+        start, end = response.find("["), response.rfind("]")
+        if start == -1 or end < start:
+            return None
+        try:
+            t_texts = json.loads(response[start : end + 1])
+        except ValueError:
+            return None
+        if (
+            not isinstance(t_texts, list)
+            or len(t_texts) != count
+            or not all(isinstance(t_text, str) for t_text in t_texts)
+        ):
+            return None
+        return [t_text.strip() for t_text in t_texts]
+
+    async def _agentic_translate_many(self, texts):
+        """
+        Translate several paragraphs concurrently, at most max_concurrency prompts
+        at a time. Paragraphs are grouped batch_size per prompt when the default
+        prompt template is used. Empty paragraphs keep their position and come
+        back as "".
+        """
+        model = self._model_name()
+        translated_list = [""] * len(texts)
+
+        pending = []
+        for i, text in enumerate(texts):
+            if not text or text.isspace():
+                continue
+            t_text = self.get_cached_translation(text, model)
+            if t_text is not None:
+                translated_list[i] = t_text
+            else:
+                pending.append(i)
+
+        # A custom template is written for a single {text}, so keep one per prompt
+        batch_size = (
+            max(self.batch_size, 1)
+            if self.prompt_template == self.DEFAULT_PROMPT
+            else 1
+        )
+        chunks = [
+            pending[i : i + batch_size] for i in range(0, len(pending), batch_size)
+        ]
+
+        async def translate_chunk(chunk):
+            async with self._sem:
+                return await self._agentic_translate_batch([texts[i] for i in chunk])
+
+        results = await _gather_or_cancel(*[translate_chunk(chunk) for chunk in chunks])
+        for chunk, t_texts in zip(chunks, results):
+            for i, t_text in zip(chunk, t_texts):
+                translated_list[i] = t_text
+                self.cache_translation(texts[i], model, t_text)
+        return translated_list
+
+    def _model_name(self):
+        return self._fallback.model if self._fallback else self.sdk_options["model"]
+
+    @staticmethod
+    def _log_translation(t_text):
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("[bold green]%s[/bold green]", _MULTI_NL.sub("\n\n", t_text))
 
     def translate(self, text):
         """Main translation method"""
-        print(text)
+        logger.info("%s", text)
+
+        # Context changes the output, so only reuse translations without it
+        if not self.context_flag:
+            t_text = self.get_cached_translation(text, self._model_name())
+            if t_text is not None:
+                self._log_translation(t_text)
+                return t_text
+
         self.rotate_key()
         
         # Use fallback if not in agentic mode
         if self._fallback:
-            return self._fallback.translate(text)
+            t_text = self._fallback.translate(text)
+            if not self.context_flag:
+                self.cache_translation(text, self._model_name(), t_text)
+            return t_text
         
         # Use agentic translation
         t_text = self._sync_wrapper(self._agentic_translate(text))
         
         if self.context_flag:
             self.save_context(text, t_text)
+        else:
+            self.cache_translation(text, self._model_name(), t_text)
         
-        print("[bold green]" + re.sub("\n{3,}", "\n\n", t_text) + "[/bold green]")
+        self._log_translation(t_text)
         return t_text
 
-    def translate_list(self, text_list):
+    @staticmethod
+    def _paragraph_text(p):
+        """Plain text of a paragraph; the loaders pass bs4 tags, like for ChatGPTAPI"""
+        if isinstance(p, str):
+            return p
+        temp_p = copy(p)
+        for sup in temp_p.find_all("sup"):
+            sup.extract()
+        return temp_p.get_text().strip()
+
+    def translate_list(self, plist):
         """
         Batch translation method for EPUBs with --accumulated_num support.
         This is optional but improves performance for batch processing.
         """
         if self._fallback and hasattr(self._fallback, 'translate_list'):
-            return self._fallback.translate_list(text_list)
-        
-        # Simple implementation: translate each item separately
-        # A more sophisticated version could batch these in a single prompt
-        translated_list = []
-        for text in text_list:
-            if text.strip():  # Skip empty strings
-                translated_list.append(self.translate(text))
-            else:
-                translated_list.append("")
+            return self._fallback.translate_list(plist)
+
+        text_list = [self._paragraph_text(p) for p in plist]
+        
+        # Fallback and context mode translate one paragraph at a time, in order
+        if self._fallback or self.context_flag:
+            translated_list = []
+            for text in text_list:
+                if text and not text.isspace():  # Skip empty strings
+                    translated_list.append(self.translate(text))
+                else:
+                    translated_list.append("")
+            return translated_list
+
+        translated_list = self._sync_wrapper(self._agentic_translate_many(text_list))
+        for text, t_text in zip(text_list, translated_list):
+            if t_text:
+                logger.info("%s", text)
+                self._log_translation(t_text)
         
         return translated_list
 
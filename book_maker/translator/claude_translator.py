@@ -1,9 +1,12 @@
 import re
+from collections import deque
 from rich import print
 from anthropic import Anthropic
 
 from .base_translator import Base
 
+_MULTI_NL = re.compile(r"\n{3,}")
+
 
 class Claude(Base):
     def __init__(
@@ -30,8 +33,8 @@ class Claude(Base):
         self.prompt_sys_msg = prompt_sys_msg or ""
         self.temperature = temperature
         self.context_flag = context_flag
-        self.context_list = []
-        self.context_translated_list = []
+        self.context_list = deque(maxlen=max(context_paragraph_limit, 0))
+        self.context_translated_list = deque(maxlen=max(context_paragraph_limit, 0))
         self.context_paragraph_limit = context_paragraph_limit
 
     def rotate_key(self):
@@ -82,11 +85,6 @@ class Claude(Base):
         self.context_list.append(text)
         self.context_translated_list.append(t_text)
 
-        # Keep only the most recent paragraphs within the limit
-        if len(self.context_list) > self.context_paragraph_limit:
-            self.context_list.pop(0)
-            self.context_translated_list.pop(0)
-
     def translate(self, text):
         print(text)
         self.rotate_key()
@@ -106,5 +104,5 @@ class Claude(Base):
         if self.context_flag:
             self.save_context(text, t_text)
 
-        print("[bold green]" + re.sub("\n{3,}", "\n\n", t_text) + "[/bold green]")
+        print("[bold green]" + _MULTI_NL.sub("\n\n", t_text) + "[/bold green]")
         return t_text
@@ -5,6 +5,8 @@ import requests
 import time
 from rich import print
 
+_MULTI_NL = re.compile(r"\n{3,}")
+
 
 class CustomAPI(Base):
     """
@@ -26,6 +28,6 @@ class CustomAPI(Base):
         post_data = json.dumps(data)
         r = requests.post(url=custom_api, data=post_data, timeout=10).text
         t_text = json.loads(r)["data"]
-        print("[bold green]" + re.sub("\n{3,}", "\n\n", t_text) + "[/bold green]")
+        print("[bold green]" + _MULTI_NL.sub("\n\n", t_text) + "[/bold green]")
         time.sleep(5)
         return t_text
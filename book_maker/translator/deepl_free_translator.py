@@ -8,6 +8,8 @@ from .base_translator import Base
 from rich import print
 from PyDeepLX import PyDeepLX
 
+_MULTI_NL = re.compile(r"\n{3,}")
+
 
 class DeepLFree(Base):
     """
@@ -62,5 +64,5 @@ class DeepLFree(Base):
         t_text = str(PyDeepLX.translate(text, "EN", self.language))
         # spider rule
         time.sleep(random.choice(self.time_random))
-        print("[bold green]" + re.sub("\n{3,}", "\n\n", t_text) + "[/bold green]")
+        print("[bold green]" + _MULTI_NL.sub("\n\n", t_text) + "[/bold green]")
         return t_text
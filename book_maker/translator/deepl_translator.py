@@ -9,6 +9,8 @@ from book_maker.utils import LANGUAGES, TO_LANGUAGE_CODE
 from .base_translator import Base
 from rich import print
 
+_MULTI_NL = re.compile(r"\n{3,}")
+
 
 class DeepL(Base):
     """
@@ -84,5 +86,5 @@ class DeepL(Base):
                 headers=self.headers,
             )
         t_text = response.json().get("text", "")
-        print("[bold green]" + re.sub("\n{3,}", "\n\n", t_text) + "[/bold green]")
+        print("[bold green]" + _MULTI_NL.sub("\n\n", t_text) + "[/bold green]")
         return t_text
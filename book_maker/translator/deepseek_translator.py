@@ -1,4 +1,4 @@
-from itertools import cycle
+from rich import print
 
 from book_maker.translator.chatgptapi_translator import ChatGPTAPI
 
@@ -41,10 +41,25 @@ class DeepSeekTranslator(ChatGPTAPI):
             **kwargs,
         )
         # Default to the chat model; can be overridden via set_model_list.
-        self.model_list = cycle(self.DEFAULT_MODEL_LIST)
+        self._models = tuple(self.DEFAULT_MODEL_LIST)
+        self._model_idx = 0
 
     def set_model_list(self, model_list):
         """Allow overriding DeepSeek model list while keeping a sensible default."""
         if not model_list:
             model_list = self.DEFAULT_MODEL_LIST
-        super().set_model_list(model_list)
+        self._models = tuple(dict.fromkeys(model_list))
+        self._model_idx = 0
+        print(f"Using model list {list(self._models)}")
+
+    def next_model(self):
+        """Return the next model round-robin; a plain index is cheaper than cycle()."""
+        model = self._models[self._model_idx]
+        self._model_idx = (self._model_idx + 1) % len(self._models)
+        return model
+
+    def rotate_model(self):
+        self.model = self.next_model()
+
+    def _tm_model(self):
+        return ",".join(sorted(self._models))
@@ -12,6 +12,8 @@ from rich import print
 
 from .base_translator import Base
 
+_MULTI_NL = re.compile(r"\n{3,}")
+
 generation_config = {
     "temperature": 1.0,
     "top_p": 1,
@@ -128,9 +130,7 @@ class Gemini(Base):
                 tag_match = re.search(tag_pattern, t_text, re.DOTALL)
                 if tag_match:
                     print(
-                        "[bold green]"
-                        + re.sub("\n{3,}", "\n\n", t_text)
-                        + "[/bold green]"
+                        "[bold green]" + _MULTI_NL.sub("\n\n", t_text) + "[/bold green]"
                     )
                     t_text = tag_match.group(1).strip()
                     # print("[bold green]" + re.sub("\n{3,}", "\n\n", t_text) + "[/bold green]")
@@ -168,7 +168,7 @@ class Gemini(Base):
         else:
             self.convo.history = []
 
-        print("[bold green]" + re.sub("\n{3,}", "\n\n", t_text) + "[/bold green]")
+        print("[bold green]" + _MULTI_NL.sub("\n\n", t_text) + "[/bold green]")
         # for rate limit(RPM)
         time.sleep(self.interval)
         if num:
@@ -5,6 +5,8 @@ from rich import print
 from book_maker.utils import TO_LANGUAGE_CODE
 from .base_translator import Base
 
+_MULTI_NL = re.compile(r"\n{3,}")
+
 
 class Google(Base):
     """
@@ -45,7 +47,7 @@ class Google(Base):
             [sentence.get("trans", "") for sentence in r.json()["sentences"]],
         )"""
         t_text = self._retry_translate(text)
-        print("[bold green]" + re.sub("\n{3,}", "\n\n", t_text) + "[/bold green]")
+        print("[bold green]" + _MULTI_NL.sub("\n\n", t_text) + "[/bold green]")
         return t_text
 
     def _retry_translate(self, text, timeout=3):
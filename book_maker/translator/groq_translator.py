@@ -1,7 +1,6 @@
 from groq import Groq
 from .chatgptapi_translator import ChatGPTAPI
 from os import linesep
-from itertools import cycle
 
 
 GROQ_MODEL_LIST = [
@@ -17,9 +16,12 @@ class GroqClient(ChatGPTAPI):
         if not self.model_list:
             model_list = list(set(GROQ_MODEL_LIST))
             print(f"Using model list {model_list}")
-            self.model_list = cycle(model_list)
+            self._use_models(model_list)
         self.model = next(self.model_list)
 
+    def _tm_model(self):
+        return ",".join(sorted(self._model_names or GROQ_MODEL_LIST))
+
     def create_chat_completion(self, text):
         self.groq_client = Groq(api_key=next(self.keys))
 
@@ -1,10 +1,13 @@
 import re
 import time
+from collections import deque
 from rich import print
 from openai import OpenAI
 
 from .base_translator import Base
 
+_MULTI_NL = re.compile(r"\n{3,}")
+
 
 class QwenTranslator(Base):
     """
@@ -95,8 +98,8 @@ class QwenTranslator(Base):
 
         # Context/Translation memory support
         self.context_flag = context_flag
-        self.context_list = []
-        self.context_translated_list = []
+        self.context_list = deque(maxlen=max(context_paragraph_limit, 0))
+        self.context_translated_list = deque(maxlen=max(context_paragraph_limit, 0))
         self.context_paragraph_limit = context_paragraph_limit
 
         print("[bold blue]Qwen Translator initialized:[/bold blue]")
@@ -159,17 +162,12 @@ class QwenTranslator(Base):
         self.context_list.append(text)
         self.context_translated_list.append(t_text)
 
-        # Keep only the most recent paragraphs within the limit
-        if len(self.context_list) > self.context_paragraph_limit:
-            self.context_list.pop(0)
-            self.context_translated_list.pop(0)
-
     def translate(self, text, needprint=True):
         """Main translation method"""
         start_time = time.time()
 
         if needprint:
-            print(re.sub(r"\n{3,}", "\n\n", text))
+            print(_MULTI_NL.sub("\n\n", text))
 
         attempt_count = 0
         max_attempts = 3
@@ -219,7 +217,7 @@ class QwenTranslator(Base):
                     time.sleep(1)  # Wait before retry
 
         if needprint:
-            print("[bold green]" + re.sub("\n{3,}", "\n\n", t_text) + "[/bold green]")
+            print("[bold green]" + _MULTI_NL.sub("\n\n", t_text) + "[/bold green]")
 
         end_time = time.time()
         print(f"[dim]Translation time: {end_time - start_time:.2f}s[/dim]")
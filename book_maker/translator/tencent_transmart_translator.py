@@ -6,6 +6,8 @@ import requests
 from rich import print
 from .base_translator import Base
 
+_MULTI_NL = re.compile(r"\n{3,}")
+
 
 class TencentTranSmart(Base):
     """
@@ -53,7 +55,7 @@ class TencentTranSmart(Base):
             self.api_url, json=api_form_data, headers=self.header, timeout=3
         )
         t_text = "".join(response.json()["auto_translation"])
-        print("[bold green]" + re.sub("\n{3,}", "\n\n", t_text) + "[/bold green]")
+        print("[bold green]" + _MULTI_NL.sub("\n\n", t_text) + "[/bold green]")
         return t_text
 
     def text_analysis(self, text):
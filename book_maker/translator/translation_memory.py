@@ -0,0 +1,45 @@
+import os
+import sqlite3
+import threading
+import time
+
+DEFAULT_TM_CACHE_PATH = os.path.join(
+    os.path.expanduser("~"), ".cache", "bbook_maker", "tm.sqlite"
+)
+
+
+class DiskTM:
+    """Translation memory stored in a SQLite file so it survives between runs"""
+
+    def __init__(self, path=DEFAULT_TM_CACHE_PATH):
+        self.path = os.path.expanduser(path)
+        os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        # translators may look up from the background event loop thread as well
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(
+            self.path, isolation_level=None, check_same_thread=False
+        )
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS tm ("
+            "hash BLOB PRIMARY KEY, translation TEXT NOT NULL, ts INTEGER NOT NULL)"
+        )
+
+    def get(self, key):
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT translation FROM tm WHERE hash = ?", (key,)
+            ).fetchone()
+        return row[0] if row else None
+
+    def put(self, key, translation):
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO tm (hash, translation, ts) VALUES (?, ?, ?)",
+                (key, translation, int(time.time())),
+            )
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
@@ -16,3 +16,6 @@ class XAIClient(ChatGPTAPI):
 
     def rotate_model(self):
         self.model = self.model_list[0]
+
+    def _tm_model(self):
+        return self.model_list[0]
@@ -0,0 +1,188 @@
+import asyncio
+import json
+import logging
+import time
+from types import SimpleNamespace
+
+import pytest
+from bs4 import BeautifulSoup
+
+pytest.importorskip("claude_code_sdk")
+
+from book_maker.translator.claude_code_translator import ClaudeCodeTranslator
+
+
+@pytest.fixture()
+def translator(monkeypatch):
+    """Agentic translator with a fake Claude Code query that prefixes "T:" """
+    t = ClaudeCodeTranslator(None, "Simplified Chinese", agentic=True)
+    prompts = []
+
+    async def fake_run_query(prompt):
+        prompts.append(prompt)
+        if "JSON array" in prompt:
+            texts = json.loads(prompt[prompt.index("[") :])
+            return json.dumps(["T:" + text for text in texts])
+        return "T:" + prompt.rsplit("\n", 1)[-1]
+
+    monkeypatch.setattr(t, "_run_query", fake_run_query)
+    t.prompts = prompts
+    return t
+
+
+def test_translate_list_accepts_tags(translator):
+    """translate_list gets bs4 tags from the epub loader's deal_old"""
+    translator.batch_size = 1
+    soup = BeautifulSoup(
+        "<p>Hello<sup>1</sup></p><p>   </p><p>World</p>", "html.parser"
+    )
+
+    result = translator.translate_list(soup.find_all("p"))
+
+    assert result == ["T:Hello", "", "T:World"]
+
+
+def test_translate_list_batches_tags(translator):
+    soup = BeautifulSoup("<p>One</p><p></p><p>Two</p><p>Three</p>", "html.parser")
+
+    result = translator.translate_list(soup.find_all("p"))
+
+    assert result == ["T:One", "", "T:Two", "T:Three"]
+    assert len(translator.prompts) == 1
+
+
+def fake_query(messages):
+    """Stands in for claude_code_sdk.query, yielding `messages` for any prompt"""
+    prompts = []
+
+    async def query(prompt, options):
+        prompts.append(prompt)
+        for message in messages:
+            yield message
+
+    query.prompts = prompts
+    return query
+
+
+def test_run_query_joins_text_blocks(monkeypatch):
+    t = ClaudeCodeTranslator(None, "Simplified Chinese", agentic=True)
+    query = fake_query(
+        [
+            SimpleNamespace(content=[SimpleNamespace(text=" 你"), SimpleNamespace()]),
+            SimpleNamespace(content=[SimpleNamespace(text="好 ")]),
+            SimpleNamespace(is_error=False, result="你好"),
+        ]
+    )
+    monkeypatch.setattr(t, "_sdk", SimpleNamespace(**{**vars(t._sdk), "query": query}))
+
+    assert t._sync_wrapper(t._run_query("Hello")) == "你好"
+    assert query.prompts == ["Hello"]
+
+
+def test_run_query_raises_error_results(monkeypatch):
+    t = ClaudeCodeTranslator(None, "Simplified Chinese", agentic=True)
+    query = fake_query([SimpleNamespace(is_error=True, result="overloaded")])
+    monkeypatch.setattr(t, "_sdk", SimpleNamespace(**{**vars(t._sdk), "query": query}))
+
+    with pytest.raises(t._sdk.ProcessError, match="overloaded"):
+        t._sync_wrapper(t._run_query("Hello"))
+
+
+def test_parse_batch_response_valid():
+    response = '[" 你好 ", "世界"]'
+
+    assert ClaudeCodeTranslator._parse_batch_response(response, 2) == ["你好", "世界"]
+
+
+def test_parse_batch_response_surrounding_prose():
+    response = 'Here are the translations:\n```json\n["你好", "世界"]\n```\nDone.'
+
+    assert ClaudeCodeTranslator._parse_batch_response(response, 2) == ["你好", "世界"]
+
+
+def test_parse_batch_response_wrong_length():
+    assert ClaudeCodeTranslator._parse_batch_response('["你好"]', 2) is None
+
+
+def test_parse_batch_response_non_string_items():
+    assert ClaudeCodeTranslator._parse_batch_response('["你好", 2]', 2) is None
+    assert ClaudeCodeTranslator._parse_batch_response('[["你好"], "世界"]', 2) is None
+
+
+def test_parse_batch_response_not_json():
+    assert ClaudeCodeTranslator._parse_batch_response("你好\n世界", 2) is None
+    assert ClaudeCodeTranslator._parse_batch_response("[你好, 世界]", 2) is None
+
+
+def test_translate_logs_paragraphs(translator, caplog):
+    caplog.set_level(
+        logging.INFO, logger="book_maker.translator.claude_code_translator"
+    )
+
+    assert translator.translate("Hello") == "T:Hello"
+    assert [r.getMessage() for r in caplog.records] == [
+        "Hello",
+        "[bold green]T:Hello[/bold green]",
+    ]
+    assert {r.threadName for r in caplog.records} == {"MainThread"}
+
+
+def test_transient_errors_are_retried(translator, monkeypatch):
+    translator.base_delay = 0
+    calls = []
+
+    async def flaky_run_query(prompt):
+        calls.append(prompt)
+        if len(calls) < 3:
+            raise translator._sdk.ProcessError("API Error: 529 overloaded")
+        return "你好"
+
+    monkeypatch.setattr(translator, "_run_query", flaky_run_query)
+
+    assert translator._sync_wrapper(translator._query_with_retry("Hello")) == "你好"
+    assert len(calls) == 3
+
+
+def test_permanent_errors_are_not_retried(translator, monkeypatch):
+    translator.base_delay = 0
+    calls = []
+
+    async def failing_run_query(prompt):
+        calls.append(prompt)
+        raise translator._sdk.ProcessError(
+            "Claude Code returned an error: Invalid API key · Please run /login"
+        )
+
+    monkeypatch.setattr(translator, "_run_query", failing_run_query)
+
+    with pytest.raises(translator._sdk.ProcessError):
+        translator._sync_wrapper(translator._query_with_retry("Hello"))
+    assert len(calls) == 1
+
+
+def test_failed_chunk_cancels_the_others(translator, monkeypatch):
+    translator.batch_size = 1
+    translator.max_retries = 0
+    finished = []
+
+    async def run_query(prompt):
+        if prompt.endswith("bad"):
+            raise translator._sdk.ProcessError("API Error: 500")
+        await asyncio.sleep(0.5)
+        finished.append(prompt)
+        return "T"
+
+    monkeypatch.setattr(translator, "_run_query", run_query)
+
+    with pytest.raises(translator._sdk.ProcessError):
+        translator.translate_list(["one", "bad", "two"])
+    time.sleep(0.6)
+    assert finished == []
+
+
+def test_negative_context_limit():
+    t = ClaudeCodeTranslator(
+        None, "Simplified Chinese", agentic=True, context_paragraph_limit=-1
+    )
+
+    assert t.create_context_messages() == ""
@@ -0,0 +1,67 @@
+from book_maker.translator.base_translator import Base
+from book_maker.translator.translation_memory import DiskTM
+
+
+class EchoTranslator(Base):
+    prompt_sys_msg = ""
+    prompt_template = "Translate to {language}: {text}"
+
+    def rotate_key(self):
+        pass
+
+    def translate(self, text):
+        return text
+
+
+def test_disk_tm_round_trip(tmp_path):
+    path = tmp_path / "tm.sqlite"
+    writer = EchoTranslator("key", "Simplified Chinese")
+    writer.set_tm_cache_path(str(path))
+    writer.cache_translation("Hello", "model", "你好")
+    writer._disk_tm.close()
+
+    reader = EchoTranslator("key", "Simplified Chinese")
+    reader.set_tm_cache_path(str(path))
+
+    assert reader.get_cached_translation("Hello", "model") == "你好"
+    assert reader.get_cached_translation("Hello", "other-model") is None
+    reader._disk_tm.close()
+
+
+def test_disk_tm_get_missing(tmp_path):
+    tm = DiskTM(str(tmp_path / "nested" / "tm.sqlite"))
+
+    assert tm.get(b"missing") is None
+    tm.close()
+
+
+def test_memory_evicts_least_recently_used(monkeypatch):
+    monkeypatch.setattr(EchoTranslator, "tm_cache_size", 2)
+    t = EchoTranslator("key", "Simplified Chinese")
+    t.cache_translation("one", "model", "1")
+    t.cache_translation("two", "model", "2")
+    # a hit makes "one" the most recently used, so "two" goes first
+    assert t.get_cached_translation("one", "model") == "1"
+    t.cache_translation("three", "model", "3")
+
+    assert len(t._tm_cache) == 2
+    assert t.get_cached_translation("two", "model") is None
+    assert t.get_cached_translation("one", "model") == "1"
+    assert t.get_cached_translation("three", "model") == "3"
+
+
+def test_prompt_change_misses():
+    t = EchoTranslator("key", "Simplified Chinese")
+    t.cache_translation("Hello", "model", "你好")
+    assert t.get_cached_translation("Hello", "model") == "你好"
+
+    t.prompt_template = "Translate this into {language}, keep it formal: {text}"
+
+    assert t.get_cached_translation("Hello", "model") is None
+
+
+def test_empty_translation_not_cached():
+    t = EchoTranslator("key", "Simplified Chinese")
+    t.cache_translation("Hello", "model", "")
+
+    assert t.get_cached_translation("Hello", "model") is None